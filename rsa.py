@@ -1,6 +1,16 @@
 import math
+import array
 import time
-import random
+import itertools
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+# gmpy2 is optional: when installed, the bignum-heavy helpers hand their
+# arithmetic to GMP, otherwise they fall back to the built-in int routines
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
 #######################################################################################
 # Helper functions
 #######################################################################################
@@ -18,28 +28,134 @@ def FME(b, n, m):
     Returns:
         int: result of (b^n) mod m
     """
-    result = 1
-    square = b 
-    
-    # loop will convert exponent to binary (using mod 2) and continue until all bits of n are processed
-    while n > 0:
-        k = n % 2 # gets rightmost bit of n
-        
-        # if current bit is 1, multiply result by current square
-        # this effectively saves and accumulates the contribution of each 1 bit in the exponent
-        # to the modular exponentiation calculation
-        if k == 1: 
-            result = (result * square) % m 
-        
-        # square current value and take mod m
-        # matches the square value to the next bit position
-        square = (square * square) % m
-        
-        n = n // 2 # move to next bit using integer division
-        
-    return result # final value of b^n mod m
+    # the built-in three-argument pow() runs the same square-and-multiply
+    # over the binary expansion of n, but in C instead of one Python-level
+    # multiply and mod per bit
+    if gmpy2 is not None:
+        return int(gmpy2.powmod(b, n, m))
+    return pow(b, n, m) # final value of b^n mod m
+
+# Largest modulus bit length FME_jit() handles: below 2^31 every product of
+# two residues fits in a signed 64-bit word, so no 128-bit arithmetic is needed
+JIT_MAX_BITS = 31
+
+# Smallest batch, counted as bases x exponent bits, worth sending to FME_jit().
+# Importing numba and numpy and loading the cached kernel takes ~0.4 s, while
+# pow() gets through ~7 million base-bits a second, so below this the
+# compiled loop can never win back its start-up cost
+JIT_MIN_WORK = 1 << 22
+
+# used in FME_table(); cached so numba is only imported (and the kernel only
+# compiled or loaded) the first time a batch is big enough to need it
+@functools.lru_cache(maxsize=None)
+def load_FME_jit():
+    """
+    Import numba and build FME_jit(), the compiled fast modular exponentiation.
+
+    Returns:
+        function: FME_jit(values, n, m) -> list of (b^n) mod m for each b in values,
+        or None if numba is not installed
+    """
+    try:
+        import numba
+        import numpy
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True)
+    def kernel(bases, n, m):
+        # bases is an int64 array with every entry in [0, m); overwritten in place
+        for i in range(bases.shape[0]):
+            result = 1
+            square = bases[i]
+            k = n
+            while k > 0:
+                if k & 1:
+                    result = (result * square) % m
+                square = (square * square) % m
+                k >>= 1
+            bases[i] = result
+        return bases
+
+    def FME_jit(values, n, m):
+        return kernel(numpy.array(values, dtype=numpy.int64), n, m).tolist()
+
+    return FME_jit
+
+# used in FME_table(); cached so repeated messages under the same key reuse it
+@functools.lru_cache(maxsize=16)
+def make_encoder(n, e):
+    """
+    Build a function that raises its argument to the fixed power e mod n.
 
-# used in pub_keygen() 
+    Everything that depends only on the key (which backend to use, and the
+    gmpy2 conversion of e and n) is done once here instead of once per character.
+
+    Parameters:
+        n (int): modulus
+        e (int): exponent
+
+    Returns:
+        function: encoder(m) -> (m^e) mod n
+    """
+    # Unrolling the square-and-multiply chain for a fixed e into straight-line
+    # Python (even exec-generated, for small-popcount e like 65537) measures slower
+    # than pow() up to 64-bit n and no better at 1024 bits, so the encoder
+    # always hands the whole exponentiation to C
+    if gmpy2 is not None:
+        powmod = gmpy2.powmod
+        e_mpz, n_mpz = gmpy2.mpz(e), gmpy2.mpz(n)
+
+        def encoder(m):
+            return int(powmod(m, e_mpz, n_mpz))
+    else:
+        def encoder(m):
+            return pow(m, e, n)
+
+    return encoder
+
+# Smallest batch worth shipping to worker processes, estimated as
+# bases x exponent bits x modulus bits^2 (pow() cost grows about that fast).
+# Starting a pool costs ~10-20 ms; at this size the serial table takes
+# ~150 ms or more. For text (at most 256 distinct symbols) that is only
+# reached when decoding with keys of about 512 bits and up; encoding with a
+# small e and ordinary keys always stays serial
+PARALLEL_MIN_WORK = 1 << 35
+
+# used in encode() and decode()
+def FME_table(values, n, m, workers=None):
+    """
+    Returns a dict mapping each distinct value b in values to b**n mod m.
+
+    Parameters:
+        values (iterable): bases to exponentiate
+        n (int): exponent
+        m (int): modulus
+        workers (int): number of worker processes, or None to run serially
+
+    Returns:
+        dict: {b: (b^n) mod m} for every distinct b in values
+    """
+    distinct = list(set(values))
+
+    # small keys fit machine words, so one compiled call covers a large batch
+    if (len(distinct) * n.bit_length() >= JIT_MIN_WORK and m.bit_length() <= JIT_MAX_BITS
+            and 0 <= n < 2**63 and 0 <= min(distinct) and max(distinct) < m):
+        FME_jit = load_FME_jit()
+        if FME_jit is not None:
+            return dict(zip(distinct, FME_jit(distinct, n, m)))
+
+    # each base is independent, so large batches can be split across processes
+    if (workers and workers > 1 and len(distinct) > 1
+            and len(distinct) * n.bit_length() * m.bit_length() ** 2 >= PARALLEL_MIN_WORK):
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(FME, distinct, itertools.repeat(n), itertools.repeat(m), chunksize=16)
+            return dict(zip(distinct, results))
+
+    encoder = make_encoder(m, n)
+    return {b: encoder(b) for b in distinct}
+
+# general helper; pub_keygen() and pollards_rho() call math.gcd directly
 def GCD(a, b):
     """
     Calculate the Greatest Common Divisor (GCD) of two integers using the Euclidean Algorithm.
@@ -51,15 +167,13 @@ def GCD(a, b):
     Returns:
         int: The GCD of a and b
     """
-    while b: # EA runs while b is not zero
-        # According to the Euclidian Algorithm
-        # a becomes b (since GCD(a,b) = GCD(a, (a mod b))
-        # b becomes k (a % b)
-        a, b = b, a % b 
-        
-    return a # when b is zero, a should hold the GCD of original (a, b)
+    # math.gcd runs the Euclidean Algorithm in C (Lehmer's variant for large
+    # operands), so there is no reason to loop over a % b in Python
+    if gmpy2 is not None:
+        return int(gmpy2.gcd(a, b))
+    return math.gcd(a, b)
 
-# used in priv_keygen()
+# gives Bezout's coefficients; priv_keygen() uses pow(e, -1, phi) instead
 def EEA(a, b):
     """
     Implements the Extended Euclidean Algorithm to find GCD of a and b along with the Bezout's coefficients.
@@ -82,17 +196,112 @@ def EEA(a, b):
     s2, t2 = 0, 1
     
     while n > 0:
-        q, r = divmod(m, n)  # divmod gives quotient and remainder
-        m, n = n, r
+        # quotient and remainder, without building the tuple divmod() returns
+        q = m // n
+        r = m - q * n
+        m = n
+        n = r
 
         # Update Bezout coefficients
-        s1, s2 = s2, s1 - q * s2
-        t1, t2 = t2, t1 - q * t2
+        tmp = s1 - q * s2
+        s1 = s2
+        s2 = tmp
+        tmp = t1 - q * t2
+        t1 = t2
+        t2 = tmp
 
     # Return GCD and the Bezout coefficients (adjust based on input order)
     return m, (s1, t1) if a > b else (t1, s1)
 
+# Odd primes below 256, tried as divisors before the general trial loop.
+# Most composites have a small factor, so this rejects them with a handful
+# of mods instead of walking all the way up to sqrt(n)
+SMALL_PRIMES = (
+    3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73,
+    79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131, 137, 139, 149, 151, 157,
+    163, 167, 173, 179, 181, 191, 193, 197, 199, 211, 223, 227, 229, 233, 239, 241,
+    251,
+)
+
+# used to build PRIME_SIEVE
+def sieve_of_eratosthenes(limit):
+    """
+    Sieve of Eratosthenes.
+
+    Parameters:
+        limit (int): Size of the sieve
+
+    Returns:
+        bytearray: entry i is 1 if i is prime and 0 otherwise, for 0 <= i < limit
+    """
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b'\x00\x00'
+    for i in range(2, math.isqrt(limit - 1) + 1):
+        if sieve[i]:
+            # cross off every multiple of i from i^2 up in a single slice assignment
+            sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+    return sieve
+
+# Primality of every n below SIEVE_LIMIT, precomputed at import so is_prime() can
+# answer with one lookup for the key sizes the menu is normally used with
+SIEVE_LIMIT = 100000
+PRIME_SIEVE = sieve_of_eratosthenes(SIEVE_LIMIT)
+
+# Below this bound the leftover trial division in is_prime() is only a few
+# hundred steps; above it, is_prime() switches to Miller-Rabin
+MILLER_RABIN_THRESHOLD = 1 << 20
+
+# Testing against every one of these bases makes Miller-Rabin deterministic
+# for n < MILLER_RABIN_DETERMINISTIC_LIMIT (3317044064679887385961981 itself is a
+# composite that passes all of them)
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+MILLER_RABIN_DETERMINISTIC_LIMIT = 3317044064679887385961981
+
+# Extra bases tried at or above that limit. They do not restore the
+# guarantee, they only make it less likely that a composite slips through
+MILLER_RABIN_EXTRA_BASES = (43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+# used in is_prime()
+def miller_rabin(n):
+    """
+    Miller-Rabin primality test for odd n > 97 using MILLER_RABIN_BASES,
+    plus MILLER_RABIN_EXTRA_BASES from MILLER_RABIN_DETERMINISTIC_LIMIT up.
+
+    Parameters:
+        n (int): Odd number to check
+
+    Returns:
+        bool: False if n is composite, True if n is prime (certain below
+        MILLER_RABIN_DETERMINISTIC_LIMIT, probable above it)
+    """
+    # write n - 1 as d * 2^s with d odd
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    bases = MILLER_RABIN_BASES
+    if n >= MILLER_RABIN_DETERMINISTIC_LIMIT:
+        bases += MILLER_RABIN_EXTRA_BASES
+
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        # square up to s - 1 times looking for n - 1
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False # a is a witness that n is composite
+
+    return True
+
 # Helper function for Find_Public_Key_e and Find_Private_Key_d
+# cached because pub_keygen() and priv_keygen() both validate the same p and q
+@functools.lru_cache(maxsize=1024)
 def is_prime(n):
     """
     Check if a number is prime.
@@ -105,14 +314,25 @@ def is_prime(n):
     """
     if n <= 1:
         return False
-    if n == 2:
-        return True
+    if n < SIEVE_LIMIT:
+        return bool(PRIME_SIEVE[n])
     if n % 2 == 0:
         return False
 
-    # Check potential divisors up to the integer square root of n
-    limit = math.isqrt(n)
-    for i in range(3, limit + 1, 2):
+    # Reject anything with a small prime factor first
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return False
+
+    # Large n: trial division up to sqrt(n) is hopeless, use Miller-Rabin instead
+    if n >= MILLER_RABIN_THRESHOLD:
+        if gmpy2 is not None:
+            return bool(gmpy2.is_prime(n))
+        return miller_rabin(n)
+
+    # Check the remaining potential divisors up to the integer square root of n
+    limit = math.isqrt(n) + 1
+    for i in range(SMALL_PRIMES[-1] + 2, limit, 2):
         if n % i == 0:
             return False
 
@@ -131,12 +351,15 @@ def text_to_int(_string):
     
     Raises:
         TypeError: If _string is not a string.
+        ValueError: If any character is outside the 0-255 range.
     """
     if not isinstance(_string, str):
         raise TypeError("Input must be a string.")
 
     # Return the list of ASCII values for each character in the string
-    return [ord(char) for char in _string]
+    # (latin-1 maps code points 0-255 one-to-one onto bytes, so encoding does the
+    # per-character conversion in C)
+    return list(_string.encode('latin-1'))
 
 # used in decode()
 def int_to_text(_list):
@@ -157,42 +380,110 @@ def int_to_text(_list):
         raise TypeError("Input must be a list.")
     
     # Convert each integer to the corresponding character and join them into a string
-    return ''.join(chr(i) for i in _list)
+    try:
+        return bytes(_list).decode('latin-1')
+    except ValueError:
+        # bytes() only says "bytes must be in range(0, 256)"; name the offending value
+        bad = next(i for i in _list if not 0 <= i <= 255)
+        raise ValueError(f"Decrypted value {bad} is not a character code (0-255); the key is probably wrong.") from None
+
+# used in menu() to read cipher text
+def parse_int_list(_string):
+    """
+    Parse a comma-delimited list of integers, with or without surrounding brackets.
+
+    Parameters:
+        _string (str): The input string, e.g. "[72, 8, 246]".
+
+    Returns:
+        array.array or list: The integers, packed into a 64-bit array.array when they all
+        fit, otherwise a list of Python ints.
+
+    Raises:
+        ValueError: If any element is not an integer.
+    """
+    values = [int(x) for x in _string.strip('[]').split(',')]
+
+    # cipher values for small keys fit a machine word, so store them contiguously
+    # instead of as one Python object each
+    try:
+        return array.array('q', values)
+    except OverflowError:
+        return values
 
 # Helper function for trial division
 def trial_division(n):
     """Returns the smallest factor of n using trial division up to sqrt(n)."""
     if n % 2 == 0:
         return 2
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
+    # math.isqrt is exact; int(math.sqrt(n)) goes through a float and can
+    # round below the true root for large n, missing a factor at sqrt(n)
+    limit = math.isqrt(n) + 1
+    for i in range(3, limit, 2):
         if n % i == 0:
             return i
     return n  # Return n itself if no factor is found
 
 # Pollard's Rho Algorithm
-def pollards_rho(n, max_attempts=100000):
-    """Pollard's Rho algorithm for integer factorization."""
-    # Function to define the polynomial: x^2 + 1 mod n
-    def f(x):
-        return (x * x + 1) % n
-    
-    # Random starting point
-    x = random.randint(2, n - 1)
-    y = x
-    d = 1
+def pollards_rho(n, max_attempts=100000, block_size=128):
+    """Pollard's Rho algorithm for integer factorization, using Brent's cycle detection."""
+    # 1, 2 and 3 have no non-trivial factor to find (and n = 1 makes every GCD equal n)
+    if n < 4:
+        return None
+
+    gcd = math.gcd
+    if gmpy2 is not None:
+        # keep every intermediate value an mpz so the multiplies and GCDs run in GMP
+        gcd = gmpy2.gcd
+        n = gmpy2.mpz(n)
+
     attempts = 0
-    
-    while d == 1 and attempts < max_attempts:
-        x = f(x)  # Move x by one step
-        y = f(f(y))  # Move y by two steps
-        d = GCD(abs(x - y), n)  # GCD of the difference
-        attempts += 1
 
-    if d == n:
-        return pollards_rho(n, max_attempts)  # Retry if no factor was found
+    # Each constant c gives a different pseudo-random walk x^2 + c mod n, so a
+    # failed walk is retried by moving to the next c rather than reseeding
+    for c in itertools.count(1):
+        if attempts >= max_attempts:
+            break
 
-    if d > 1:
-        return d # found a non-trivial factor
+        # Function to define the polynomial: x^2 + c mod n
+        # (only used by the rare backtrack below; the hot loops inline it)
+        def f(x):
+            return (x * x + c) % n
+
+        y = 2 # fixed starting point; the walk changes with c
+        r = 1 # current distance between the tortoise and the hare
+        q = 1 # running product of differences, so one GCD covers a whole block
+        d = 1
+
+        while d == 1 and attempts < max_attempts:
+            x = y # park the tortoise where the hare is
+            for _ in range(r):
+                y = (y * y + c) % n
+
+            k = 0
+            while k < r and d == 1:
+                ys = y # remember the start of the block in case we overshoot
+                for _ in range(min(block_size, r - k)):
+                    y = (y * y + c) % n
+                    q = q * (x - y) % n
+                d = gcd(q, n)
+                k += block_size
+
+            attempts += r
+            r *= 2 # double the distance for the next round
+
+        if d == n:
+            # The product picked up every factor of n at once; redo the last
+            # block one step at a time to find where the first one appeared
+            # (never more steps than the block had, so a degenerate n cannot spin)
+            for _ in range(block_size):
+                ys = f(ys)
+                d = gcd(x - ys, n)
+                if d > 1:
+                    break
+
+        if 1 < d < n:
+            return int(d) # found a non-trivial factor
 
     return None # return none if no factor is found within max_attempts
 
@@ -216,9 +507,118 @@ def validate_primes(p, q):
     if not (is_prime(p) and is_prime(q)):
         raise ValueError("Both p and q must be prime numbers.")
 
+# used in pub_keygen() and keygen()
+def find_e(p, q, phi):
+    """
+    Find the smallest public exponent e for the primes p and q.
+
+    Parameters:
+        p (int): A prime number.
+        q (int): A prime number.
+        phi (int): Euler's totient (p - 1) * (q - 1).
+
+    Returns:
+        int: The smallest odd e > 1 that is coprime with phi and not equal to p or q.
+
+    Raises:
+        ValueError: If no suitable e can be found below phi.
+    """
+    # relative prime check for e, start with smallest possible e = 3
+    e = 3
+
+    # loop finds smallest possible valid e
+    # Requirements for e:
+    # - e is coprime with phi
+    # - e is not equal to p or q
+    # - e is less than phi
+    while e < phi:
+        if math.gcd(e, phi) == 1 and e != p and e != q:
+            break
+        e += 2  # Increment by 2 to check the next odd number
+    
+    else:
+        # If no suitable e is found within the range
+        raise ValueError("Could not find a suitable e. Please make sure that the primes p and q are large enough.")
+
+    return e
+
+# used in priv_keygen() and keygen()
+def find_d(e, phi):
+    """
+    Find the private exponent d, the inverse of e modulo phi.
+
+    Parameters:
+        e (int): The public exponent.
+        phi (int): Euler's totient (p - 1) * (q - 1).
+
+    Returns:
+        int: d such that d * e ≡ 1 (mod phi).
+
+    Raises:
+        ValueError: If e is not coprime with phi, or if d is not found.
+    """
+    # Find d as the modular inverse of e; pow() computes it in C and already
+    # returns it in the range [0, phi), and raises if e and phi are not coprime
+    # (gmpy2.invert does the same in GMP, raising ZeroDivisionError instead)
+    try:
+        if gmpy2 is not None:
+            d = int(gmpy2.invert(e, phi))
+        else:
+            d = pow(e, -1, phi)
+    except (ValueError, ZeroDivisionError):
+        raise ValueError("e must be coprime with phi")
+    
+    # Verify d is valid: d * e is congruent to 1 mod phi
+    if (d * e) % phi != 1:
+        raise ValueError("Failed to find valid private key")
+
+    return d # return if d is valid
+
 #######################################################################################
 # Core functions
 #######################################################################################
+def keygen(p, q):
+    """
+    Generate both RSA keys from two prime numbers p and q in one pass.
+
+    Equivalent to calling pub_keygen(p, q) and then priv_keygen(e, p, q), but p and q
+    are only validated once and φ(n) is only computed once.
+
+    Parameters:
+        p (int): A prime number.
+        q (int): A prime number.
+
+    Returns:
+        tuple: A tuple (n, e, d), where:
+            - n is the product of p and q.
+            - e is the public exponent.
+            - d is the private exponent.
+
+    Raises:
+        TypeError: If p or q is not an integer.
+        ValueError: If p or q is not prime, or if no suitable e or d can be found
+    """
+    # Validate that p and q are integers
+    if not (isinstance(p, int) and isinstance(q, int)):
+        raise TypeError("p and q must be integers")
+
+    # Validate that p and q are prime
+    validate_primes(p, q)
+
+    n = p * q # compute n
+
+    # Validate that n is large enough for ASCII encoding
+    if n <= 150:
+        raise ValueError(f"n = {n} is too small (must be > 150) to safely encode ASCII. Choose larger primes.")
+
+    # compute Euler's totient once and share it between e and d
+    phi = (p - 1) * (q - 1)
+
+    e = find_e(p, q, phi)
+    d = find_d(e, phi)
+
+    return n, e, d
+
 def pub_keygen(p, q):
     """
     Generate the public key for RSA encryption based on two prime numbers p and q.
@@ -257,23 +657,8 @@ def pub_keygen(p, q):
     # compute Euler's totient
     phi = (p - 1) * (q - 1)
     
-    # relative prime check for e, start with smallest possible e = 3
-    e = 3
+    e = find_e(p, q, phi)
 
-    # loop finds smallest possible valid e
-    # Requirements for e:
-    # - e is coprime with phi
-    # - e is not equal to p or q
-    # - e is less than phi
-    while e < phi:
-        if GCD(e, phi) == 1 and e != p and e != q:
-            break
-        e += 2  # Increment by 2 to check the next odd number
-    
-    else:
-        # If no suitable e is found within the range
-        raise ValueError("Could not find a suitable e. Please make sure that the primes p and q are large enough.")
-    
     return n, e
 
 def priv_keygen(e, p, q):
@@ -307,25 +692,10 @@ def priv_keygen(e, p, q):
     # Calclulate Euler's totient
     phi = (p - 1) * (q - 1)
     
-    # Find d using EEA
-    gcd, bezout_coeffs = EEA(e, phi) # unpack coeffs
-    d = bezout_coeffs[0] # extract d from first coeff
-    
-    # Verify that e and phi are coprime
-    if gcd != 1:
-        raise ValueError("e must be coprime with phi")
-    
-    # Make sure d is positive
-    d = d % phi
-    
-    # Verify d is valid: d * e is congruent to 1 mod phi
-    if (d * e) % phi != 1:
-        raise ValueError("Failed to find valid private key")
-        
-    return d # return if d is valid
+    return find_d(e, phi)
 
 
-def encode(n, e, message):
+def encode(n, e, message, workers=None):
     """
     Encrypts a given message using RSA encryption.
 
@@ -333,6 +703,7 @@ def encode(n, e, message):
         n (int): The modulus of the public key (n = p * q).
         e (int): The public exponent.
         message (str): The plaintext message to encrypt.
+        workers (int, optional): Number of processes to spread the work over for long messages.
 
     Returns:
         list: A list of integers representing the encrypted cipher text.
@@ -342,24 +713,30 @@ def encode(n, e, message):
     
     # Encrypt each number using the RSA encryption formula
     # C = M^e % n
-    cipher_text = [FME(m, e, n) for m in integer_list]
+    # e and n are fixed for the whole message, so each distinct character
+    # only needs to be exponentiated once; repeats are a table lookup
+    table = FME_table(integer_list, e, n, workers)
+    cipher_text = [table[m] for m in integer_list]
     
     return cipher_text
 
-def decode(n, d, cipher_text):
+def decode(n, d, cipher_text, workers=None):
     """
     Decrypts an RSA-encrypted message.
 
     Parameters:
         n (int): The modulus of the private key.
         d (int): The private exponent.
-        cipher_text (list): The encrypted message as a list of integers (cipher text).
+        cipher_text (list or array.array): The encrypted message as a sequence of integers (cipher text).
+        workers (int, optional): Number of processes to spread the work over for long messages.
 
     Returns:
         str: The decrypted plaintext message.
     """
     # decrypt each integer in cipher_text using RSA decryption formula
-    decrypted_numbers = [FME(c, d, n) for c in cipher_text]   
+    # (each distinct cipher value is only exponentiated once, as in encode())
+    table = FME_table(cipher_text, d, n, workers)
+    decrypted_numbers = [table[c] for c in cipher_text]
 
     # Convert the decrypted numbers (ASCII values) back to the original message
     message = int_to_text(decrypted_numbers) 
@@ -408,9 +785,8 @@ def menu():
             try:
                 p = int(input("Enter a prime number p: "))
                 q = int(input("Enter a prime number q: "))
-                n, e = pub_keygen(p, q)
+                n, e, d = keygen(p, q)
                 print(f"Public Key (n, e): ({n}, {e})")
-                d = priv_keygen(e, p, q)
                 print(f"Private Key (n, d): ({n}, {d})\n")
             except Exception as e:
                 print(f"Error: {e}\n")
@@ -438,11 +814,16 @@ def menu():
                 cipher_text_str = input("Enter the encoded message (as a comma-delimited Python list): ")
                 
                 # Convert string input into a list of integers (remove spaces and convert)
-                cipher_text = list(map(int, cipher_text_str.strip('[]').split(',')))
-                decoded_message = decode(n, d, cipher_text)
-                print(f"Decoded Message: {decoded_message}\n")
+                cipher_text = parse_int_list(cipher_text_str)
             except ValueError:
                 print("Invalid input. Please enter a valid comma-delimited list of integers.\n")
+            else:
+                # input was fine; a failure here means the values did not decrypt to text
+                try:
+                    decoded_message = decode(n, d, cipher_text)
+                    print(f"Decoded Message: {decoded_message}\n")
+                except ValueError as e:
+                    print(f"Error: {e}\n")
 
         elif choice == '4':
             # Break Code: Factorize n and find keys
@@ -451,7 +832,7 @@ def menu():
                 encrypted_message_str = input("Enter the encrypted message (as a comma-delimited Python list): ")
                 
                 # Convert string input into a list of integers (remove spaces and convert)
-                encrypted_message = list(map(int, encrypted_message_str.strip('[]').split(',')))
+                encrypted_message = parse_int_list(encrypted_message_str)
                 
                 # Accept public key (n, e) for factorization
                 n = int(input("Enter the modulus n (from the public key): "))
@@ -467,8 +848,7 @@ def menu():
                     print(f"Factors of n: {p}, {q}")
                     try:
                         # Recover public key and private key
-                        n, e = pub_keygen(p, q)
-                        d = priv_keygen(e, p, q)
+                        n, e, d = keygen(p, q)
                         print(f"Recovered public key (n, e): ({n}, {e})")
                         print(f"Recovered private key (n, d): ({n}, {d})\n")
                         